@@ -1,556 +1,759 @@
-import krpc
-import time
-import os
-from datetime import datetime
-
-
-class DualLogger:
-    """Класс для одновременного вывода в консоль и файл"""
-
-    def __init__(self, filename="ksp.txt"):
-        self.filename = filename
-        # Очищаем файл при запуске или создаем новый
-        with open(self.filename, 'w', encoding='utf-8') as f:
-            f.write(f"=== ЛОГ АВТОПИЛОТА KSP ===\n")
-            f.write(f"Дата запуска: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("=" * 40 + "\n\n")
-
-    def log(self, message, show_time=True):
-        """Записывает сообщение в файл и выводит в консоль"""
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        if show_time:
-            log_message = f"[{timestamp}] {message}"
-        else:
-            log_message = message
-
-        # Вывод в консоль
-        print(log_message)
-
-        # Запись в файл
-        with open(self.filename, 'a', encoding='utf-8') as f:
-            f.write(log_message + "\n")
-
-    def section(self, title):
-        """Заголовок раздела"""
-        border = "=" * 50
-        self.log(border, False)
-        self.log(title.upper(), False)
-        self.log(border, False)
-
-
-class FlightDataLogger:
-    """Класс для постоянной записи данных о полете в файл inf.txt"""
-    
-    def __init__(self, vessel, conn):
-        self.vessel = vessel
-        self.conn = conn
-        self.filename = "inf.txt"
-        self.start_time = time.time()
-        
-        # Настройка потоков данных
-        self.altitude_stream = conn.add_stream(getattr, vessel.flight(), 'mean_altitude')
-        self.apoapsis_stream = conn.add_stream(getattr, vessel.orbit, 'apoapsis_altitude')
-        self.periapsis_stream = conn.add_stream(getattr, vessel.orbit, 'periapsis_altitude')
-        
-        # Создаем референсный фрейм для скорости
-        self.body = vessel.orbit.body
-        self.flight = vessel.flight(self.body.reference_frame)
-        self.vertical_speed_stream = conn.add_stream(getattr, self.flight, 'vertical_speed')
-        self.horizontal_speed_stream = conn.add_stream(getattr, self.flight, 'horizontal_speed')
-        
-        # Полная скорость
-        self.speed_stream = conn.add_stream(getattr, self.flight, 'speed')
-        
-        # Направление (траектория)
-        self.pitch_stream = conn.add_stream(getattr, self.flight, 'pitch')
-        self.heading_stream = conn.add_stream(getattr, self.flight, 'heading')
-        
-        # Инициализация файла
-        self._init_file()
-        
-    def _init_file(self):
-        """Инициализация файла с заголовками"""
-        with open(self.filename, 'w', encoding='utf-8') as f:
-            f.write("=" * 60 + "\n")
-            f.write("ДАННЫЕ О ПОЛЕТЕ - ПОСТОЯННАЯ ЗАПИСЬ\n")
-            f.write(f"Начало записи: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Корабль: {self.vessel.name}\n")
-            f.write(f"Планета: {self.body.name}\n")
-            f.write("=" * 60 + "\n\n")
-            
-            # Заголовки столбцов
-            headers = [
-                "Время(с)",
-                "Высота(км)",
-                "Скорость(м/с)",
-                "Верт.скорость(м/с)",
-                "Гор.скорость(м/с)",
-                "Апоапсис(км)",
-                "Периапсис(км)",
-                "Тангаж(°)",
-                "Курс(°)",
-                "Топливо",
-                "Окислитель"
-            ]
-            f.write(" | ".join(headers) + "\n")
-            f.write("-" * 120 + "\n")
-    
-    def log_data(self):
-        """Запись текущих данных полета в файл"""
-        try:
-            # Получаем текущие значения
-            current_time = time.time() - self.start_time
-            altitude = self.altitude_stream()
-            speed = self.speed_stream()
-            v_speed = self.vertical_speed_stream()
-            h_speed = self.horizontal_speed_stream()
-            apoapsis = self.apoapsis_stream()
-            periapsis = self.periapsis_stream()
-            pitch = self.pitch_stream()
-            heading = self.heading_stream()
-            
-            # Получаем ресурсы
-            fuel = self.vessel.resources.amount('LiquidFuel')
-            oxidizer = self.vessel.resources.amount('Oxidizer')
-            
-            # Форматируем строку данных
-            data_line = [
-                f"{current_time:6.1f}",
-                f"{altitude/1000:8.2f}",
-                f"{speed:8.1f}",
-                f"{v_speed:8.1f}",
-                f"{h_speed:8.1f}",
-                f"{apoapsis/1000:8.2f}",
-                f"{periapsis/1000:8.2f}",
-                f"{pitch:8.1f}",
-                f"{heading:8.1f}",
-                f"{fuel:8.1f}",
-                f"{oxidizer:8.1f}"
-            ]
-            
-            # Записываем в файл
-            with open(self.filename, 'a', encoding='utf-8') as f:
-                f.write(" | ".join(data_line) + "\n")
-                
-        except Exception as e:
-            print(f"Ошибка записи данных: {e}")
-    
-    def log_status(self, status):
-        """Запись статуса миссии в файл"""
-        with open(self.filename, 'a', encoding='utf-8') as f:
-            f.write(f"\n[{datetime.now().strftime('%H:%M:%S')}] {status}\n")
-    
-    def close(self):
-        """Завершение записи и добавление итогов"""
-        elapsed_time = time.time() - self.start_time
-        with open(self.filename, 'a', encoding='utf-8') as f:
-            f.write("\n" + "=" * 60 + "\n")
-            f.write("ИТОГИ ЗАПИСИ\n")
-            f.write(f"Общее время полета: {elapsed_time:.1f} секунд\n")
-            f.write(f"Конец записи: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("=" * 60 + "\n")
-
-
-def get_fuel(vessel):
-    """Функция для получения количества топлива"""
-    try:
-        return vessel.resources.amount('LiquidFuel')
-    except:
-        return 0
-
-
-def get_oxidizer(vessel):
-    """Функция для получения количества окислителя"""
-    try:
-        return vessel.resources.amount('Oxidizer')
-    except:
-        return 0
-
-
-def main():
-    logger = DualLogger("ksp.txt")
-    flight_data_logger = None  # Инициализация позже
-
-    logger.log("=" * 50, False)
-    logger.log("AUTOPILOT FOR KSP", False)
-    logger.log("=" * 50, False)
-    logger.log(f"Файл лога: {os.path.abspath('ksp.txt')}")
-    logger.log(f"Файл данных полета: {os.path.abspath('inf.txt')}")
-
-    # Подключение к KSP
-    try:
-        logger.log("Подключаюсь к KSP через kRPC...")
-        conn = krpc.connect(
-            name='KSP_Autopilot',
-            address='localhost',
-            rpc_port=50000,
-            stream_port=50001
-        )
-        logger.log("✓ Успешное подключение к KSP!")
-    except Exception as e:
-        logger.log(f"✗ Ошибка подключения: {e}")
-        logger.log("Убедитесь, что:")
-        logger.log("1. KSP запущена")
-        logger.log("2. kRPC сервер активен (Esc → Settings → kRPC → Start Server)")
-        input("Нажмите Enter для выхода...")
-        return
-
-    # Основные объекты
-    vessel = conn.space_center.active_vessel
-    body = vessel.orbit.body
-
-    # Инициализация логгера данных полета
-    try:
-        flight_data_logger = FlightDataLogger(vessel, conn)
-        logger.log("✓ Инициализирован сбор данных полета в inf.txt")
-    except Exception as e:
-        logger.log(f"⚠ Ошибка инициализации логгера данных: {e}")
-
-    # Настройка потоков данных (без лямбд)
-    altitude = conn.add_stream(getattr, vessel.flight(), 'mean_altitude')
-    apoapsis = conn.add_stream(getattr, vessel.orbit, 'apoapsis_altitude')
-    periapsis = conn.add_stream(getattr, vessel.orbit, 'periapsis_altitude')
-
-    # Для топлива будем использовать прямые вызовы, а не потоки
-    # Из-за ошибки в kRPC с лямбда-функциями
-
-    flight = vessel.flight(body.reference_frame)
-    vertical_speed = conn.add_stream(getattr, flight, 'vertical_speed')
-    horizontal_speed = conn.add_stream(getattr, flight, 'horizontal_speed')
-
-    # Информация о корабле
-    logger.section("Информация о корабле")
-    logger.log(f"Корабль: {vessel.name}")
-    logger.log(f"Планета: {body.name}")
-
-    # Получаем начальные значения топлива
-    initial_fuel = vessel.resources.amount('LiquidFuel')
-    max_fuel = vessel.resources.max('LiquidFuel')
-    initial_ox = vessel.resources.amount('Oxidizer')
-    max_ox = vessel.resources.max('Oxidizer')
-
-    logger.log(f"Начальное топливо: {initial_fuel:.1f} / {max_fuel:.1f}")
-    logger.log(f"Окислитель: {initial_ox:.1f} / {max_ox:.1f}")
-
-    # Запись начального статуса в файл данных
-    if flight_data_logger:
-        flight_data_logger.log_status("СТАРТ МИССИИ - РАКЕТА НА СТАРТОВОЙ ПЛОЩАДКЕ")
-
-    input("\nНажмите Enter для начала автопилота... (убедитесь, что ракета на старте!)")
-
-    # === 1. Включить двигатель на полную ===
-    logger.section("Фаза 1: Запуск двигателя")
-    logger.log("1. ВКЛЮЧАЮ ДВИГАТЕЛЬ НА ПОЛНУЮ")
-
-    # Обратный отсчет
-    for i in range(3, 0, -1):
-        logger.log(f"Запуск через {i}...")
-        time.sleep(1)
-
-    logger.log("ЗАПУСК! Полный газ!")
-    vessel.control.throttle = 1.0
-    vessel.control.activate_next_stage()
-    
-    # Запись статуса запуска
-    if flight_data_logger:
-        flight_data_logger.log_status("ЗАПУСК ДВИГАТЕЛЯ - ПОЛНЫЙ ГАЗ")
-    
-    time.sleep(1)
-
-    # === 2. Включить SAS направление радиально наружу ===
-    logger.log("2. ВКЛЮЧАЮ SAS: RADIAL OUT")
-    vessel.control.sas = True
-    time.sleep(0.5)
-    try:
-        vessel.control.sas_mode = conn.space_center.SASMode.radial
-        logger.log("✓ SAS установлен в режим RadialOut")
-    except Exception as e:
-        logger.log(f"⚠ SAS radial недоступен: {e}")
-
-    # === 3. На 10км отключить SAS и повернуть на 20° ===
-    logger.section("Фаза 2: Гравитационный поворот")
-    logger.log("3. ОЖИДАНИЕ ВЫСОТЫ 10 КМ...")
-
-    last_report = time.time()
-    last_data_log = time.time()
-    while altitude() < 10000:
-        current_time = time.time()
-        
-        # Запись данных каждые 0.5 секунды
-        if current_time - last_data_log > 0.5 and flight_data_logger:
-            flight_data_logger.log_data()
-            last_data_log = current_time
-        
-        if current_time - last_report > 2:
-            # Получаем текущие значения
-            current_fuel = vessel.resources.amount('LiquidFuel')
-            logger.log(f"  Высота: {altitude() / 1000:.1f} км | "
-                       f"V: {vertical_speed():.0f} м/с | "
-                       f"H: {horizontal_speed():.0f} м/с | "
-                       f"Топливо: {current_fuel:.0f}")
-            last_report = current_time
-        time.sleep(0.1)
-
-    logger.log(f"✓ 10 км достигнуто ({altitude() / 1000:.1f} км)")
-    logger.log("  Отключаю SAS, поворачиваю на 20°")
-    
-    if flight_data_logger:
-        flight_data_logger.log_status("ДОСТИГНУТО 10 КМ - ГРАВИТАЦИОННЫЙ ПОВОРОТ")
-
-    vessel.control.sas = False
-    time.sleep(0.5)
-
-    ap = vessel.auto_pilot
-    ap.reference_frame = vessel.surface_reference_frame
-    ap.engage()
-    ap.target_pitch_and_heading(70, 90)  # 90-20=70°
-    ap.wait()
-    ap.disengage()
-    logger.log("  ✓ Поворот на 20° завершен")
-
-    # === 4. Не выключать двигатель, пока апоапсис не будет 80 км ===
-    logger.section("Фаза 3: Выведение до апоапсиса 80 км")
-    logger.log("4. ОЖИДАНИЕ АПОАПСИСА 80 КМ...")
-
-    last_report = time.time()
-    fuel_warnings = 0
-    target_pitch = vessel.flight().pitch
-    
-    while apoapsis() < 80000:
-        
-        # Запись данных каждые 0.5 секунды
-        current_time = time.time()
-        if current_time - last_data_log > 0.5 and flight_data_logger:
-            flight_data_logger.log_data()
-            last_data_log = current_time
-        
-        if vessel.flight().pitch > 15:
-            ap.engage()
-            target_pitch -= 0.3
-            ap.target_pitch_and_heading(target_pitch, vessel.flight().heading)
-            logger.log(f"Плавный поворот {vessel.flight().pitch}")
-        
-        current_apo = apoapsis()
-        current_fuel = vessel.resources.amount('LiquidFuel')
-        current_time = time.time()
-
-        # Отчет каждые 3 секунды
-        if current_time - last_report > 3:
-            progress = (current_apo / 80000) * 100
-            logger.log(f"  Апоапсис: {current_apo / 1000:.1f} км ({progress:.0f}%) | "
-                       f"Высота: {altitude() / 1000:.1f} км | "
-                       f"Топливо: {current_fuel:.0f}")
-            last_report = current_time
-
-        # Предупреждения о топливе
-        if current_fuel < 100 and fuel_warnings == 0:
-            logger.log(f"  ⚠ Мало топлива: {current_fuel:.0f} осталось")
-            fuel_warnings += 1
-        elif current_fuel < 50 and fuel_warnings == 1:
-            logger.log(f"  ⚠ Очень мало топлива: {current_fuel:.0f} осталось")
-            fuel_warnings += 1
-
-        time.sleep(0.2)
-
-    logger.log(f"✓ Апоапсис {apoapsis() / 1000:.1f} км достигнут")
-    logger.log("  ВЫКЛЮЧАЮ ДВИГАТЕЛЬ")
-    vessel.control.throttle = 0.0
-    ap.disengage()
-    
-    if flight_data_logger:
-        flight_data_logger.log_status(f"ДОСТИГНУТ АПОАПСИС {apoapsis()/1000:.1f} КМ - ВЫКЛЮЧЕНИЕ ДВИГАТЕЛЯ")
-
-    # Сохраняем данные после первой фазы
-    fuel_after_ascent = vessel.resources.amount('LiquidFuel')
-    oxidizer_after_ascent = vessel.resources.amount('Oxidizer')
-    logger.log(f"  Осталось после набора высоты:")
-    logger.log(f"    Топливо: {fuel_after_ascent:.1f}")
-    logger.log(f"    Окислитель: {oxidizer_after_ascent:.1f}")
-
-    # === 5. Развернуть солнечные панели ===
-    logger.section("Фаза 4: Развертывание систем")
-    logger.log("5. РАЗВОРАЧИВАЮ СОЛНЕЧНЫЕ ПАНЕЛИ")
-    
-    if flight_data_logger:
-        flight_data_logger.log_status("РАЗВЕРТЫВАНИЕ СОЛНЕЧНЫХ ПАНЕЛЕЙ")
-
-    solar_count = 0
-    for panel in vessel.parts.solar_panels:
-        try:
-            if panel.deployable:
-                panel.deployed = True
-                solar_count += 1
-        except Exception as e:
-            logger.log(f"  ⚠ Ошибка с панелью: {e}")
-
-    if solar_count > 0:
-        logger.log(f"  ✓ Развернуто солнечных панелей: {solar_count}")
-    else:
-        logger.log("  ⚠ Солнечные панели не найдены")
-
-    # === 6. Дождаться высоты ~80 км ===
-    logger.section("Фаза 5: Ожидание апоапсиса")
-    logger.log("6. ОЖИДАНИЕ ВЫСОТЫ ~80 КМ...")
-    
-    if flight_data_logger:
-        flight_data_logger.log_status("ОЖИДАНИЕ АПОАПСИСА 80 КМ")
-
-    while altitude() < 78000:
-        # Запись данных каждые 1 секунду (реже, так как корабль в невесомости)
-        current_time = time.time()
-        if current_time - last_data_log > 1.0 and flight_data_logger:
-            flight_data_logger.log_data()
-            last_data_log = current_time
-            
-        remaining = 78000 - altitude()
-        if remaining < 5000:
-            current_fuel = vessel.resources.amount('LiquidFuel')
-            logger.log(f"  До цели: {remaining / 1000:.1f} км | "
-                       f"Текущая высота: {altitude() / 1000:.1f} км | "
-                       f"Топливо: {current_fuel:.1f}")
-        time.sleep(0.5)
-
-    logger.log(f"✓ Высота {altitude() / 1000:.1f} км достигнута")
-
-    # === 7. SAS по направлению движения и жечь до периапсиса 75 км ===
-    logger.section("Фаза 6: Орбитальный маневр")
-    logger.log("7. ПОДГОТОВКА К ОРБИТАЛЬНОМУ МАНЕВРУ")
-    
-    if flight_data_logger:
-        flight_data_logger.log_status("НАЧАЛО ОРБИТАЛЬНОГО МАНЕВРА")
-
-    logger.log("  Устанавливаю SAS: Prograde")
-    vessel.control.sas = True
-    time.sleep(0.5)
-    try:
-        vessel.control.sas_mode = conn.space_center.SASMode.prograde
-        logger.log("  ✓ SAS установлен в режим Prograde")
-    except Exception as e:
-        logger.log(f"  ⚠ SAS prograde недоступен: {e}")
-
-    logger.log("  ВКЛЮЧАЮ ДВИГАТЕЛЬ")
-    vessel.control.throttle = 1.0
-    
-    if flight_data_logger:
-        flight_data_logger.log_status("ВКЛЮЧЕНИЕ ДВИГАТЕЛЯ ДЛЯ ОРБИТАЛЬНОГО МАНЕВРА")
-
-    # Получаем начальные значения для маневра
-    maneuver_start_fuel = vessel.resources.amount('LiquidFuel')
-    maneuver_start_time = time.time()
-
-    logger.log(f"  Цель: периапсис 75 км (текущий: {periapsis() / 1000:.1f} км)")
-    logger.log(f"  Начальный запас топлива: {maneuver_start_fuel:.1f}")
-
-    # Мониторинг маневра
-    last_report = time.time()
-    fuel_empty = False
-
-    while periapsis() < 75000:
-        # Запись данных каждые 0.3 секунды (часто, так как это активный маневр)
-        current_time = time.time()
-        if current_time - last_data_log > 0.3 and flight_data_logger:
-            flight_data_logger.log_data()
-            last_data_log = current_time
-            
-        current_fuel = vessel.resources.amount('LiquidFuel')
-        current_oxidizer = vessel.resources.amount('Oxidizer')
-        current_time = time.time()
-
-        # Проверка топлива
-        if current_fuel <= 0.1 or current_oxidizer <= 0.1:
-            logger.log("  ✗ ТОПЛИВО КОНЧИЛОСЬ!")
-            fuel_empty = True
-            break
-
-        # Отчет каждые 2 секунды
-        if current_time - last_report > 2:
-            fuel_used = maneuver_start_fuel - current_fuel
-            time_elapsed = current_time - maneuver_start_time
-            progress = (periapsis() / 75000) * 100 if periapsis() > 0 else 0
-
-            logger.log(f"  Периапсис: {periapsis() / 1000:.1f} км ({progress:.0f}%) | "
-                       f"Топливо: {current_fuel:.1f} | "
-                       f"Использовано: {fuel_used:.1f} | "
-                       f"Время: {time_elapsed:.0f}с")
-            last_report = current_time
-
-        time.sleep(0.2)
-
-    # Выключаем двигатель в любом случае
-    vessel.control.throttle = 0.0
-    logger.log("  Двигатель выключен")
-    
-    if flight_data_logger:
-        flight_data_logger.log_status(f"ЗАВЕРШЕНИЕ МАНЕВРА - ПЕРИАПСИС {periapsis()/1000:.1f} КМ")
-
-    # === ИТОГИ ===
-    logger.section("Результаты миссии")
-
-    final_apo = apoapsis()
-    final_peri = periapsis()
-    final_fuel = vessel.resources.amount('LiquidFuel')
-    final_ox = vessel.resources.amount('Oxidizer')
-
-    logger.log("ПАРАМЕТРЫ ОРБИТЫ:")
-    logger.log(f"  Апоапсис: {final_apo / 1000:.2f} км")
-    logger.log(f"  Периапсис: {final_peri / 1000:.2f} км")
-
-    try:
-        eccentricity = vessel.orbit.eccentricity
-        logger.log(f"  Эксцентриситет: {eccentricity:.4f}")
-    except:
-        logger.log("  Эксцентриситет: недоступен")
-
-    logger.log("\nОСТАТОК РЕСУРСОВ:")
-    logger.log(f"  Топливо: {final_fuel:.1f}")
-    logger.log(f"  Окислитель: {final_ox:.1f}")
-
-    logger.log("\nСТАТИСТИКА ПОЛЕТА:")
-    logger.log(f"  Топливо израсходовано на маневр: {maneuver_start_fuel - final_fuel:.1f}")
-    logger.log(f"  Общее время маневра: {time.time() - maneuver_start_time:.1f}с")
-
-    # Анализ результата
-    logger.log("\nАНАЛИЗ РЕЗУЛЬТАТА:")
-
-    if fuel_empty:
-        logger.log("✗ НЕУДАЧА: Топливо закончилось до завершения маневра")
-        if final_peri > 0:
-            logger.log(f"  Достигнута высота периапсиса: {final_peri / 1000:.1f} км")
-            logger.log("  Рекомендация: Увеличить запас топлива или уменьшить целевую орбиту")
-        else:
-            logger.log("  Суборбитальная траектория - периапсис под поверхностью")
-            logger.log("  Критическая ошибка: недостаточно топлива для выхода на орбиту")
-    elif final_peri >= 70000:
-        logger.log("✓ УСПЕХ: Орбита достигнута!")
-        if final_peri >= 74000 and final_peri <= 76000:
-            logger.log("  Отличная точность! Орбита в целевом диапазоне")
-        else:
-            logger.log(f"  Орбита стабильная, но не идеальная ({final_peri / 1000:.1f} км)")
-    elif final_peri > 0:
-        logger.log("⚠ Частичный успех: Субоптимальная орбита")
-        logger.log(f"  Периапсис {final_peri / 1000:.1f} км - требует корректировки")
-    else:
-        logger.log("✗ КРИТИЧЕСКАЯ НЕУДАЧА: Суборбитальная траектория")
-        logger.log("  Ракета упадет на поверхность")
-        logger.log("  Необходимо полностью пересмотреть конструкцию или профиль полета")
-
-    # Завершение записи данных полета
-    if flight_data_logger:
-        flight_data_logger.log_status("ЗАВЕРШЕНИЕ МИССИИ")
-        flight_data_logger.close()
-        logger.log(f"\n✓ Данные полета сохранены в: {os.path.abspath('inf.txt')}")
-
-    # Закрываем соединение
-    conn.close()
-
-    logger.log("\n" + "=" * 50, False)
-    logger.log(f"Лог событий: {os.path.abspath('ksp.txt')}", False)
-    logger.log(f"Данные полета: {os.path.abspath('inf.txt')}", False)
-    logger.log("=" * 50, False)
-
-    input("\nНажмите Enter для завершения...")
-
-
-if __name__ == '__main__':
-    main()
-
+import atexit
+import krpc
+import queue
+import sys
+import threading
+import time
+import os
+from datetime import datetime
+
+# Опциональный io_uring для потока-писателя: на Linux с установленным
+# liburing пакеты телеметрии уходят в ядро через очередь запросов.
+# Без него — обычный os.write, поведение то же
+try:
+    import liburing
+    _HAS_LIBURING = sys.platform == 'linux'
+except ImportError:
+    _HAS_LIBURING = False
+
+# Маркер "сбросить буфер на диск" для потока-писателя
+_FLUSH = object()
+
+# Заглушка вместо методов логгера данных, когда телеметрия отключена
+_NOOP = lambda *args: None
+
+# Шаблон строки телеметрии: один %-формат на C-уровне вместо 11 f-строк
+# и join на каждый тик. Шаблон байтовый — строка состоит из ASCII-цифр
+# и разделителей, так что шаг encode('utf-8') не нужен вовсе
+_ROW_FMT = (b"%6.1f | %8.2f | %8.1f | %8.1f | %8.1f | "
+            b"%8.2f | %8.2f | %8.1f | %8.1f | %8.1f | %8.1f\n")
+
+# Постоянные рамки и заголовки — считаем один раз при импорте
+_BORDER50 = "=" * 50
+_BORDER60 = "=" * 60
+_DASH120 = "-" * 120
+_HEADER_ROW = " | ".join([
+    "Время(с)",
+    "Высота(км)",
+    "Скорость(м/с)",
+    "Верт.скорость(м/с)",
+    "Гор.скорость(м/с)",
+    "Апоапсис(км)",
+    "Периапсис(км)",
+    "Тангаж(°)",
+    "Курс(°)",
+    "Топливо",
+    "Окислитель"
+]) + "\n"
+
+
+class DualLogger:
+    """Класс для одновременного вывода в консоль и файл"""
+
+    def __init__(self, filename="ksp.txt"):
+        self.filename = filename
+        # Очищаем файл при запуске или создаем новый
+        with open(self.filename, 'w', encoding='utf-8') as f:
+            f.write(f"=== ЛОГ АВТОПИЛОТА KSP ===\n")
+            f.write(f"Дата запуска: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write("=" * 40 + "\n\n")
+
+        # Открываем файл один раз и держим дескриптор —
+        # open/close на каждую строку слишком дорого.
+        # Бинарный режим + буфер 128 КиБ: один write() syscall
+        # на десятки строк вместо одного на каждую
+        self._fh = open(self.filename, 'ab', buffering=131072)
+        atexit.register(self.close)
+
+        # Кэш метки времени: сообщения часто идут пачками в одну секунду,
+        # пересчитывать strftime для каждого не нужно
+        self._ts_epoch = 0
+        self._ts_str = ""
+
+    def _timestamp(self):
+        """Возвращает строку ЧЧ:ММ:СС, пересчитывая её раз в секунду"""
+        now = int(time.time())
+        if now != self._ts_epoch:
+            self._ts_str = time.strftime('%H:%M:%S', time.localtime(now))
+            self._ts_epoch = now
+        return self._ts_str
+
+    def log(self, message, show_time=True):
+        """Записывает сообщение в файл и выводит в консоль"""
+        if show_time:
+            log_message = f"[{self._timestamp()}] {message}"
+        else:
+            log_message = message
+
+        # Вывод в консоль
+        print(log_message)
+
+        # Запись в файл
+        self._fh.write((log_message + "\n").encode('utf-8'))
+
+    def section(self, title):
+        """Заголовок раздела"""
+        self.log(_BORDER50, False)
+        self.log(title.upper(), False)
+        self.log(_BORDER50, False)
+
+    def close(self):
+        """Закрывает файл лога (повторный вызов безопасен)"""
+        if not self._fh.closed:
+            self._fh.flush()
+            self._fh.close()
+
+
+class FlightDataLogger:
+    """Класс для постоянной записи данных о полете в файл inf.txt"""
+    
+    def __init__(self, vessel, conn, min_delta=(50.0, 50.0, 1.0)):
+        self.vessel = vessel
+        self.conn = conn
+        self.filename = "inf.txt"
+        self.start_time = time.time()
+
+        # Пороги (высота м, апоапсис м, скорость м/с): строка пишется, только
+        # если хотя бы одно значение заметно изменилось с прошлой записи —
+        # на баллистическом участке это убирает почти одинаковые строки
+        self.min_delta = min_delta
+        self._last_row = None
+        
+        # Настройка потоков данных
+        self.altitude_stream = conn.add_stream(getattr, vessel.flight(), 'mean_altitude')
+        self.apoapsis_stream = conn.add_stream(getattr, vessel.orbit, 'apoapsis_altitude')
+        self.periapsis_stream = conn.add_stream(getattr, vessel.orbit, 'periapsis_altitude')
+        
+        # Создаем референсный фрейм для скорости
+        self.body = vessel.orbit.body
+        self.flight = vessel.flight(self.body.reference_frame)
+        self.vertical_speed_stream = conn.add_stream(getattr, self.flight, 'vertical_speed')
+        self.horizontal_speed_stream = conn.add_stream(getattr, self.flight, 'horizontal_speed')
+        
+        # Полная скорость
+        self.speed_stream = conn.add_stream(getattr, self.flight, 'speed')
+        
+        # Направление (траектория)
+        self.pitch_stream = conn.add_stream(getattr, self.flight, 'pitch')
+        self.heading_stream = conn.add_stream(getattr, self.flight, 'heading')
+
+        # Ресурсы: поток вместо RPC на каждый вызов resources.amount
+        self.fuel_stream, self.oxidizer_stream = make_resource_readers(conn, vessel)
+
+        # Инициализация файла (заголовки — через обычный текстовый API)
+        self._init_file()
+
+        # Для самих данных — сырой файловый дескриптор: строки телеметрии
+        # уже отформатированы, пачки пишем одним os.write без прослойки
+        # TextIOWrapper/BufferedWriter (батчинг делает поток-писатель)
+        self._fd = os.open(self.filename,
+                           os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+        # Кольцо io_uring, если доступно; используется только потоком-писателем
+        self._ring = None
+        if _HAS_LIBURING:
+            try:
+                self._ring = liburing.io_uring()
+                liburing.io_uring_queue_init(64, self._ring, 0)
+            except Exception:
+                self._ring = None
+
+        # Накопитель строк телеметрии: пишем на диск пачками,
+        # а не по одной строке на каждый тик цикла
+        self._buf = []
+        self._buf_bytes = 0
+
+        # Вся дисковая запись — в фоновом потоке: цикл управления
+        # только кладет строку в очередь и сразу возвращается к опросу.
+        # Один производитель / один потребитель, поэтому SimpleQueue
+        self.q = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+        atexit.register(self._close_fh)
+
+    def _writer_loop(self):
+        """Фоновый поток: забирает строки из очереди и пишет пачками"""
+        while True:
+            item = self.q.get()
+            if item is None:
+                break
+            if item is _FLUSH:
+                self._drain()
+                continue
+            self._buf.append(item)
+            self._buf_bytes += len(item)
+            if len(self._buf) >= 32 or self._buf_bytes >= 65536:
+                self._drain()
+        self._drain()
+
+    def _drain(self):
+        """Сбрасывает накопленные строки телеметрии на диск одной записью"""
+        if self._buf:
+            self._write_block(b"".join(self._buf))
+            self._buf = []
+            self._buf_bytes = 0
+
+    def _write_block(self, data):
+        """Пишет блок данных: через io_uring, если доступен, иначе os.write"""
+        while self._ring is not None:
+            try:
+                sqe = liburing.io_uring_get_sqe(self._ring)
+                liburing.io_uring_prep_write(sqe, self._fd, data, len(data), -1)
+                liburing.io_uring_submit(self._ring)
+                cqe = liburing.io_uring_cqe()
+                liburing.io_uring_wait_cqe(self._ring, cqe)
+                written = cqe.res
+                liburing.io_uring_cqe_seen(self._ring, cqe)
+            except Exception:
+                # При любой проблеме с кольцом откатываемся на os.write
+                self._ring = None
+                break
+            if written < 0:
+                # Ошибка записи в завершении (например, ENOSPC) —
+                # пробуем обычным os.write, чтобы не потерять пачку молча
+                self._ring = None
+                break
+            if written >= len(data):
+                return
+            # Короткая запись: дописываем остаток следующей отправкой
+            data = data[written:]
+        os.write(self._fd, data)
+
+    def _stop_writer(self):
+        """Останавливает поток-писатель, дождавшись записи остатка очереди"""
+        if self._writer.is_alive():
+            self.q.put(None)
+            self._writer.join()
+
+    def _close_fh(self):
+        """Закрывает дескриптор файла данных (повторный вызов безопасен)"""
+        if self._fd is not None:
+            self._stop_writer()
+            if self._ring is not None:
+                liburing.io_uring_queue_exit(self._ring)
+                self._ring = None
+            os.close(self._fd)
+            self._fd = None
+
+    def _init_file(self):
+        """Инициализация файла с заголовками"""
+        with open(self.filename, 'w', encoding='utf-8') as f:
+            f.write(_BORDER60 + "\n")
+            f.write("ДАННЫЕ О ПОЛЕТЕ - ПОСТОЯННАЯ ЗАПИСЬ\n")
+            f.write(f"Начало записи: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write(f"Корабль: {self.vessel.name}\n")
+            f.write(f"Планета: {self.body.name}\n")
+            f.write(_BORDER60 + "\n\n")
+
+            # Заголовки столбцов
+            f.write(_HEADER_ROW)
+            f.write(_DASH120 + "\n")
+    
+    def log_data(self):
+        """Запись текущих данных полета в файл"""
+        try:
+            # Получаем текущие значения
+            current_time = time.time() - self.start_time
+            altitude = self.altitude_stream()
+            speed = self.speed_stream()
+            v_speed = self.vertical_speed_stream()
+            h_speed = self.horizontal_speed_stream()
+            apoapsis = self.apoapsis_stream()
+            periapsis = self.periapsis_stream()
+            pitch = self.pitch_stream()
+            heading = self.heading_stream()
+            
+            # Получаем ресурсы (из потоков — без RPC)
+            fuel = self.fuel_stream()
+            oxidizer = self.oxidizer_stream()
+
+            # Пропускаем строку, если с прошлой записи ничего заметно
+            # не изменилось (дельта-фильтр для участков покоя)
+            if self._last_row is not None:
+                last_alt, last_apo, last_speed = self._last_row
+                d_alt, d_apo, d_speed = self.min_delta
+                if (abs(altitude - last_alt) < d_alt
+                        and abs(apoapsis - last_apo) < d_apo
+                        and abs(speed - last_speed) < d_speed):
+                    return
+            self._last_row = (altitude, apoapsis, speed)
+            
+            # Форматируем строку данных одним вызовом по готовому шаблону
+            # и сразу передаем байты потоку-писателю
+            self.q.put_nowait(_ROW_FMT % (current_time, altitude / 1000,
+                                          speed, v_speed, h_speed,
+                                          apoapsis / 1000, periapsis / 1000,
+                                          pitch, heading, fuel, oxidizer))
+
+        except Exception as e:
+            print(f"Ошибка записи данных: {e}")
+
+    def log_status(self, status):
+        """Запись статуса миссии в файл"""
+        # Очередь сохраняет порядок относительно телеметрии;
+        # события миссии редкие и важные — сразу просим сброс на диск
+        line = f"\n[{datetime.now().strftime('%H:%M:%S')}] {status}\n"
+        self.q.put(line.encode('utf-8'))
+        self.q.put(_FLUSH)
+
+    def close(self):
+        """Завершение записи и добавление итогов"""
+        elapsed_time = time.time() - self.start_time
+        footer = ("\n" + _BORDER60 + "\n"
+                  "ИТОГИ ЗАПИСИ\n"
+                  f"Общее время полета: {elapsed_time:.1f} секунд\n"
+                  f"Конец записи: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                  + _BORDER60 + "\n")
+        self.q.put(footer.encode('utf-8'))
+        self._close_fh()
+
+
+def make_resource_readers(conn, vessel):
+    """Возвращает пару потоков (топливо, окислитель).
+
+    Чтение из потока — локальная операция без RPC; при отсутствии
+    ресурса поток отдает 0, так что обертка с try/except не нужна.
+    """
+    fuel_stream = conn.add_stream(vessel.resources.amount, 'LiquidFuel')
+    oxidizer_stream = conn.add_stream(vessel.resources.amount, 'Oxidizer')
+    return fuel_stream, oxidizer_stream
+
+
+def main():
+    # Абсолютные пути считаем один раз — abspath каждый раз дергает getcwd()
+    ksp_log_path = os.path.abspath('ksp.txt')
+    inf_log_path = os.path.abspath('inf.txt')
+
+    logger = DualLogger("ksp.txt")
+    flight_data_logger = None  # Инициализация позже
+
+    logger.log(_BORDER50, False)
+    logger.log("AUTOPILOT FOR KSP", False)
+    logger.log(_BORDER50, False)
+    logger.log(f"Файл лога: {ksp_log_path}")
+    logger.log(f"Файл данных полета: {inf_log_path}")
+
+    # Подключение к KSP
+    try:
+        logger.log("Подключаюсь к KSP через kRPC...")
+        conn = krpc.connect(
+            name='KSP_Autopilot',
+            address='localhost',
+            rpc_port=50000,
+            stream_port=50001
+        )
+        logger.log("✓ Успешное подключение к KSP!")
+    except Exception as e:
+        logger.log(f"✗ Ошибка подключения: {e}")
+        logger.log("Убедитесь, что:")
+        logger.log("1. KSP запущена")
+        logger.log("2. kRPC сервер активен (Esc → Settings → kRPC → Start Server)")
+        input("Нажмите Enter для выхода...")
+        return
+
+    # Основные объекты. Часто используемые цепочки атрибутов поднимаем
+    # в локальные переменные один раз: каждый такой dereference в kRPC —
+    # потенциальный RPC, а в CPython — лишний LOAD_ATTR в горячем цикле
+    vessel = conn.space_center.active_vessel
+    body = vessel.orbit.body
+    control = vessel.control
+    resources = vessel.resources
+    sas_modes = conn.space_center.SASMode
+
+    # Инициализация логгера данных полета
+    try:
+        flight_data_logger = FlightDataLogger(vessel, conn)
+        logger.log("✓ Инициализирован сбор данных полета в inf.txt")
+    except Exception as e:
+        logger.log(f"⚠ Ошибка инициализации логгера данных: {e}")
+
+    # Настройка потоков данных (без лямбд).
+    # Если логгер данных создан — переиспользуем его потоки: значения всех
+    # подписок приходят одним сообщением обновления от сервера, а дубликаты
+    # подписок лишь заставляют KSP считать то же самое дважды
+    if flight_data_logger:
+        altitude = flight_data_logger.altitude_stream
+        apoapsis = flight_data_logger.apoapsis_stream
+        periapsis = flight_data_logger.periapsis_stream
+        fuel_stream = flight_data_logger.fuel_stream
+        oxidizer_stream = flight_data_logger.oxidizer_stream
+        vertical_speed = flight_data_logger.vertical_speed_stream
+        horizontal_speed = flight_data_logger.horizontal_speed_stream
+    else:
+        altitude = conn.add_stream(getattr, vessel.flight(), 'mean_altitude')
+        apoapsis = conn.add_stream(getattr, vessel.orbit, 'apoapsis_altitude')
+        periapsis = conn.add_stream(getattr, vessel.orbit, 'periapsis_altitude')
+        fuel_stream, oxidizer_stream = make_resource_readers(conn, vessel)
+        flight = vessel.flight(body.reference_frame)
+        vertical_speed = conn.add_stream(getattr, flight, 'vertical_speed')
+        horizontal_speed = conn.add_stream(getattr, flight, 'horizontal_speed')
+
+    # Функции записи телеметрии связываем один раз: если логгер не создался
+    # или телеметрия отключена (KSP_LOG_TELEMETRY=0) — вызываем заглушку,
+    # и горячим циклам не нужна проверка flight_data_logger на каждом тике
+    telemetry_on = (flight_data_logger is not None
+                    and os.environ.get('KSP_LOG_TELEMETRY', '1') == '1')
+    log_data_fn = flight_data_logger.log_data if telemetry_on else _NOOP
+    log_status_fn = flight_data_logger.log_status if telemetry_on else _NOOP
+
+    # Информация о корабле
+    logger.section("Информация о корабле")
+    logger.log(f"Корабль: {vessel.name}")
+    logger.log(f"Планета: {body.name}")
+
+    # Получаем начальные значения топлива
+    initial_fuel = fuel_stream()
+    max_fuel = resources.max('LiquidFuel')
+    initial_ox = oxidizer_stream()
+    max_ox = resources.max('Oxidizer')
+
+    logger.log(f"Начальное топливо: {initial_fuel:.1f} / {max_fuel:.1f}")
+    logger.log(f"Окислитель: {initial_ox:.1f} / {max_ox:.1f}")
+
+    # Запись начального статуса в файл данных
+    log_status_fn("СТАРТ МИССИИ - РАКЕТА НА СТАРТОВОЙ ПЛОЩАДКЕ")
+
+    input("\nНажмите Enter для начала автопилота... (убедитесь, что ракета на старте!)")
+
+    # === 1. Включить двигатель на полную ===
+    logger.section("Фаза 1: Запуск двигателя")
+    logger.log("1. ВКЛЮЧАЮ ДВИГАТЕЛЬ НА ПОЛНУЮ")
+
+    # Обратный отсчет в фоновом потоке: пока тикают секунды, основной
+    # поток успевает записать предстартовый статус и снять телеметрию,
+    # а не простаивать 3 секунды без единой строки данных
+    def _countdown():
+        for i in range(3, 0, -1):
+            logger.log(f"Запуск через {i}...")
+            time.sleep(1)
+
+    countdown = threading.Thread(target=_countdown)
+    countdown.start()
+
+    log_status_fn("ОБРАТНЫЙ ОТСЧЕТ")
+    log_data_fn()
+
+    # Двигатель включаем только после завершения отсчета
+    countdown.join()
+
+    logger.log("ЗАПУСК! Полный газ!")
+    control.throttle = 1.0
+    control.activate_next_stage()
+    
+    # Запись статуса запуска
+    log_status_fn("ЗАПУСК ДВИГАТЕЛЯ - ПОЛНЫЙ ГАЗ")
+    
+    time.sleep(1)
+
+    # === 2. Включить SAS направление радиально наружу ===
+    logger.log("2. ВКЛЮЧАЮ SAS: RADIAL OUT")
+    control.sas = True
+    time.sleep(0.5)
+    try:
+        control.sas_mode = sas_modes.radial
+        logger.log("✓ SAS установлен в режим RadialOut")
+    except Exception as e:
+        logger.log(f"⚠ SAS radial недоступен: {e}")
+
+    # === 3. На 10км отключить SAS и повернуть на 20° ===
+    logger.section("Фаза 2: Гравитационный поворот")
+    logger.log("3. ОЖИДАНИЕ ВЫСОТЫ 10 КМ...")
+
+    # Ждем обновлений потока вместо слепого sleep: сервер будит нас сам,
+    # и из цикла выходим в пределах одного кадра после пересечения порога
+    altitude.rate = 10
+    last_report = time.time()
+    last_data_log = time.time()
+    with altitude.condition:
+        while altitude() < 10000:
+            altitude.wait()
+            current_time = time.time()
+
+            # Запись данных каждые 0.5 секунды
+            if current_time - last_data_log > 0.5:
+                log_data_fn()
+                last_data_log = current_time
+
+            if current_time - last_report > 2:
+                # Получаем текущие значения
+                current_fuel = fuel_stream()
+                logger.log(f"  Высота: {altitude() / 1000:.1f} км | "
+                           f"V: {vertical_speed():.0f} м/с | "
+                           f"H: {horizontal_speed():.0f} м/с | "
+                           f"Топливо: {current_fuel:.0f}")
+                last_report = current_time
+
+    logger.log(f"✓ 10 км достигнуто ({altitude() / 1000:.1f} км)")
+    logger.log("  Отключаю SAS, поворачиваю на 20°")
+    
+    log_status_fn("ДОСТИГНУТО 10 КМ - ГРАВИТАЦИОННЫЙ ПОВОРОТ")
+
+    control.sas = False
+    time.sleep(0.5)
+
+    ap = vessel.auto_pilot
+    ap.reference_frame = vessel.surface_reference_frame
+    ap.engage()
+    ap.target_pitch_and_heading(70, 90)  # 90-20=70°
+    ap.wait()
+    ap.disengage()
+    logger.log("  ✓ Поворот на 20° завершен")
+
+    # === 4. Не выключать двигатель, пока апоапсис не будет 80 км ===
+    logger.section("Фаза 3: Выведение до апоапсиса 80 км")
+    logger.log("4. ОЖИДАНИЕ АПОАПСИСА 80 КМ...")
+
+    # Тангаж/курс для управления берем из поверхностной системы координат —
+    # той же, в которой работает автопилот; объект flight и потоки
+    # создаем один раз вне цикла, а не по RPC на каждую итерацию
+    flight_srf = vessel.flight(vessel.surface_reference_frame)
+    srf_pitch_stream = conn.add_stream(getattr, flight_srf, 'pitch')
+    srf_heading_stream = conn.add_stream(getattr, flight_srf, 'heading')
+
+    apoapsis.rate = 5
+    last_report = time.time()
+    fuel_warnings = 0
+    target_pitch = srf_pitch_stream()
+
+    with apoapsis.condition:
+        while apoapsis() < 80000:
+            apoapsis.wait()
+
+            # Запись данных каждые 0.5 секунды
+            current_time = time.time()
+            if current_time - last_data_log > 0.5:
+                log_data_fn()
+                last_data_log = current_time
+
+            if srf_pitch_stream() > 15:
+                ap.engage()
+                target_pitch -= 0.3
+                ap.target_pitch_and_heading(target_pitch, srf_heading_stream())
+                logger.log(f"Плавный поворот {srf_pitch_stream()}")
+
+            current_time = time.time()
+
+            # Отчет каждые 3 секунды; топливо читаем и проверяем только здесь,
+            # чтобы не делать лишней работы на тиках без отчета
+            if current_time - last_report > 3:
+                current_apo = apoapsis()
+                current_fuel = fuel_stream()
+                progress = (current_apo / 80000) * 100
+                logger.log(f"  Апоапсис: {current_apo / 1000:.1f} км ({progress:.0f}%) | "
+                           f"Высота: {altitude() / 1000:.1f} км | "
+                           f"Топливо: {current_fuel:.0f}")
+                last_report = current_time
+
+                # Предупреждения о топливе
+                if current_fuel < 100 and fuel_warnings == 0:
+                    logger.log(f"  ⚠ Мало топлива: {current_fuel:.0f} осталось")
+                    fuel_warnings += 1
+                elif current_fuel < 50 and fuel_warnings == 1:
+                    logger.log(f"  ⚠ Очень мало топлива: {current_fuel:.0f} осталось")
+                    fuel_warnings += 1
+
+    logger.log(f"✓ Апоапсис {apoapsis() / 1000:.1f} км достигнут")
+    logger.log("  ВЫКЛЮЧАЮ ДВИГАТЕЛЬ")
+    control.throttle = 0.0
+    ap.disengage()
+    
+    log_status_fn(f"ДОСТИГНУТ АПОАПСИС {apoapsis()/1000:.1f} КМ - ВЫКЛЮЧЕНИЕ ДВИГАТЕЛЯ")
+
+    # Сохраняем данные после первой фазы
+    fuel_after_ascent = fuel_stream()
+    oxidizer_after_ascent = oxidizer_stream()
+    logger.log(f"  Осталось после набора высоты:")
+    logger.log(f"    Топливо: {fuel_after_ascent:.1f}")
+    logger.log(f"    Окислитель: {oxidizer_after_ascent:.1f}")
+
+    # === 5. Развернуть солнечные панели ===
+    logger.section("Фаза 4: Развертывание систем")
+    logger.log("5. РАЗВОРАЧИВАЮ СОЛНЕЧНЫЕ ПАНЕЛИ")
+    
+    log_status_fn("РАЗВЕРТЫВАНИЕ СОЛНЕЧНЫХ ПАНЕЛЕЙ")
+
+    solar_count = 0
+    for panel in vessel.parts.solar_panels:
+        try:
+            if panel.deployable:
+                panel.deployed = True
+                solar_count += 1
+        except Exception as e:
+            logger.log(f"  ⚠ Ошибка с панелью: {e}")
+
+    if solar_count > 0:
+        logger.log(f"  ✓ Развернуто солнечных панелей: {solar_count}")
+    else:
+        logger.log("  ⚠ Солнечные панели не найдены")
+
+    # === 6. Дождаться высоты ~80 км ===
+    logger.section("Фаза 5: Ожидание апоапсиса")
+    logger.log("6. ОЖИДАНИЕ ВЫСОТЫ ~80 КМ...")
+    
+    log_status_fn("ОЖИДАНИЕ АПОАПСИСА 80 КМ")
+
+    # На баллистическом участке обновления нужны реже
+    altitude.rate = 2
+    with altitude.condition:
+        while altitude() < 78000:
+            altitude.wait()
+
+            # Запись данных каждые 1 секунду (реже, так как корабль в невесомости)
+            current_time = time.time()
+            if current_time - last_data_log > 1.0:
+                log_data_fn()
+                last_data_log = current_time
+
+            remaining = 78000 - altitude()
+            if remaining < 5000:
+                current_fuel = fuel_stream()
+                logger.log(f"  До цели: {remaining / 1000:.1f} км | "
+                           f"Текущая высота: {altitude() / 1000:.1f} км | "
+                           f"Топливо: {current_fuel:.1f}")
+
+    logger.log(f"✓ Высота {altitude() / 1000:.1f} км достигнута")
+
+    # === 7. SAS по направлению движения и жечь до периапсиса 75 км ===
+    logger.section("Фаза 6: Орбитальный маневр")
+    logger.log("7. ПОДГОТОВКА К ОРБИТАЛЬНОМУ МАНЕВРУ")
+    
+    log_status_fn("НАЧАЛО ОРБИТАЛЬНОГО МАНЕВРА")
+
+    logger.log("  Устанавливаю SAS: Prograde")
+    control.sas = True
+    time.sleep(0.5)
+    try:
+        control.sas_mode = sas_modes.prograde
+        logger.log("  ✓ SAS установлен в режим Prograde")
+    except Exception as e:
+        logger.log(f"  ⚠ SAS prograde недоступен: {e}")
+
+    logger.log("  ВКЛЮЧАЮ ДВИГАТЕЛЬ")
+    control.throttle = 1.0
+    
+    log_status_fn("ВКЛЮЧЕНИЕ ДВИГАТЕЛЯ ДЛЯ ОРБИТАЛЬНОГО МАНЕВРА")
+
+    # Получаем начальные значения для маневра
+    maneuver_start_fuel = fuel_stream()
+    maneuver_start_time = time.time()
+
+    logger.log(f"  Цель: периапсис 75 км (текущий: {periapsis() / 1000:.1f} км)")
+    logger.log(f"  Начальный запас топлива: {maneuver_start_fuel:.1f}")
+
+    # Мониторинг маневра
+    periapsis.rate = 5
+    last_report = time.time()
+    fuel_empty = False
+
+    with periapsis.condition:
+        while periapsis() < 75000:
+            # Таймаут обязателен: после выгорания топлива периапсис перестает
+            # меняться, обновлений потока больше нет, и без таймаута проверка
+            # топлива ниже никогда бы не выполнилась
+            periapsis.wait(timeout=0.2)
+
+            # Запись данных каждые 0.3 секунды (часто, так как это активный маневр)
+            current_time = time.time()
+            if current_time - last_data_log > 0.3:
+                log_data_fn()
+                last_data_log = current_time
+
+            current_fuel = fuel_stream()
+            current_oxidizer = oxidizer_stream()
+            current_time = time.time()
+
+            # Проверка топлива
+            if current_fuel <= 0.1 or current_oxidizer <= 0.1:
+                logger.log("  ✗ ТОПЛИВО КОНЧИЛОСЬ!")
+                fuel_empty = True
+                break
+
+            # Отчет каждые 2 секунды
+            if current_time - last_report > 2:
+                fuel_used = maneuver_start_fuel - current_fuel
+                time_elapsed = current_time - maneuver_start_time
+                progress = (periapsis() / 75000) * 100 if periapsis() > 0 else 0
+
+                logger.log(f"  Периапсис: {periapsis() / 1000:.1f} км ({progress:.0f}%) | "
+                           f"Топливо: {current_fuel:.1f} | "
+                           f"Использовано: {fuel_used:.1f} | "
+                           f"Время: {time_elapsed:.0f}с")
+                last_report = current_time
+
+    # Выключаем двигатель в любом случае
+    control.throttle = 0.0
+    logger.log("  Двигатель выключен")
+    
+    log_status_fn(f"ЗАВЕРШЕНИЕ МАНЕВРА - ПЕРИАПСИС {periapsis()/1000:.1f} КМ")
+
+    # === ИТОГИ ===
+    logger.section("Результаты миссии")
+
+    final_apo = apoapsis()
+    final_peri = periapsis()
+    final_fuel = fuel_stream()
+    final_ox = oxidizer_stream()
+
+    logger.log("ПАРАМЕТРЫ ОРБИТЫ:")
+    logger.log(f"  Апоапсис: {final_apo / 1000:.2f} км")
+    logger.log(f"  Периапсис: {final_peri / 1000:.2f} км")
+
+    try:
+        eccentricity = vessel.orbit.eccentricity
+        logger.log(f"  Эксцентриситет: {eccentricity:.4f}")
+    except:
+        logger.log("  Эксцентриситет: недоступен")
+
+    logger.log("\nОСТАТОК РЕСУРСОВ:")
+    logger.log(f"  Топливо: {final_fuel:.1f}")
+    logger.log(f"  Окислитель: {final_ox:.1f}")
+
+    logger.log("\nСТАТИСТИКА ПОЛЕТА:")
+    logger.log(f"  Топливо израсходовано на маневр: {maneuver_start_fuel - final_fuel:.1f}")
+    logger.log(f"  Общее время маневра: {time.time() - maneuver_start_time:.1f}с")
+
+    # Анализ результата
+    logger.log("\nАНАЛИЗ РЕЗУЛЬТАТА:")
+
+    if fuel_empty:
+        logger.log("✗ НЕУДАЧА: Топливо закончилось до завершения маневра")
+        if final_peri > 0:
+            logger.log(f"  Достигнута высота периапсиса: {final_peri / 1000:.1f} км")
+            logger.log("  Рекомендация: Увеличить запас топлива или уменьшить целевую орбиту")
+        else:
+            logger.log("  Суборбитальная траектория - периапсис под поверхностью")
+            logger.log("  Критическая ошибка: недостаточно топлива для выхода на орбиту")
+    elif final_peri >= 70000:
+        logger.log("✓ УСПЕХ: Орбита достигнута!")
+        if final_peri >= 74000 and final_peri <= 76000:
+            logger.log("  Отличная точность! Орбита в целевом диапазоне")
+        else:
+            logger.log(f"  Орбита стабильная, но не идеальная ({final_peri / 1000:.1f} км)")
+    elif final_peri > 0:
+        logger.log("⚠ Частичный успех: Субоптимальная орбита")
+        logger.log(f"  Периапсис {final_peri / 1000:.1f} км - требует корректировки")
+    else:
+        logger.log("✗ КРИТИЧЕСКАЯ НЕУДАЧА: Суборбитальная траектория")
+        logger.log("  Ракета упадет на поверхность")
+        logger.log("  Необходимо полностью пересмотреть конструкцию или профиль полета")
+
+    # Завершение записи данных полета
+    if flight_data_logger:
+        log_status_fn("ЗАВЕРШЕНИЕ МИССИИ")
+        flight_data_logger.close()
+        logger.log(f"\n✓ Данные полета сохранены в: {inf_log_path}")
+
+    # Закрываем соединение
+    conn.close()
+
+    logger.log("\n" + _BORDER50, False)
+    logger.log(f"Лог событий: {ksp_log_path}", False)
+    logger.log(f"Данные полета: {inf_log_path}", False)
+    logger.log(_BORDER50, False)
+
+    input("\nНажмите Enter для завершения...")
+
+
+if __name__ == '__main__':
+    main()
+